@@ -9,6 +9,7 @@ Orchestrates command execution for PR review:
 - Returns structured list of commands to execute with their target files
 """
 
+import codecs
 import fnmatch
 import json
 import os
@@ -31,9 +32,11 @@ def load_commands_config(config_path: Path) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(config_path, 'r', encoding='utf-8-sig') as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        raw = config_path.read_bytes()
+        if raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        config = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         print(f"[ERROR] Failed to load config: {e}", file=sys.stderr)
         return None
 
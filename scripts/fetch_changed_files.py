@@ -7,6 +7,7 @@ Outputs JSON with file paths, change types, and line counts.
 """
 
 import argparse
+import codecs
 import json
 import os
 import sys
@@ -267,9 +268,11 @@ def load_config(config_path: Optional[Path] = None) -> Optional[Dict]:
         return None
 
     try:
-        with open(config_path, 'r', encoding='utf-8-sig') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        raw = config_path.read_bytes()
+        if raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        return json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         print(f"Error loading config: {e}", file=sys.stderr)
         return None
 
@@ -303,13 +306,13 @@ def main():
         print("Error: Platform not specified. Use --platform or configure in pr-review.json", file=sys.stderr)
         sys.exit(1)
 
-    # Get token
-    if args.token:
-        token = args.token
-    elif platform == "github":
-        token, _ = resolve_github_token(prompt_if_missing=False)
-    else:
-        token, _ = resolve_token(config, prompt_if_missing=False)
+    # Get token (PR_REVIEW_TOKEN is how run_pr_review.py passes --token)
+    token = args.token or os.environ.get("PR_REVIEW_TOKEN")
+    if not token:
+        if platform == "github":
+            token, _ = resolve_github_token(prompt_if_missing=False)
+        else:
+            token, _ = resolve_token(config, prompt_if_missing=False)
 
     if not token:
         env_var = "GITHUB_PAT" if platform == "github" else "AZURE_DEVOPS_PAT"
@@ -261,7 +261,8 @@ Examples:
     args = parser.parse_args()
 
     # Get token from args or environment
-    token = args.token or os.getenv("GITHUB_PAT")
+    # (PR_REVIEW_TOKEN is how run_pr_review.py passes --token)
+    token = args.token or os.environ.get("PR_REVIEW_TOKEN") or os.getenv("GITHUB_PAT")
     if not token:
         print("Error: No token provided. Use --token or set GITHUB_PAT environment variable", file=sys.stderr)
         sys.exit(1)
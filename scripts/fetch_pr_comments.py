@@ -100,7 +100,7 @@ class ADOCommentFetcher:
         self._debug_log(f"Parameters: {params}")
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = requests.get(url, headers=self.headers, params=params, timeout=60)
             self._debug_log(f"Response status: {response.status_code}")
 
             # Handle 401 with token renewal
@@ -110,7 +110,7 @@ class ADOCommentFetcher:
                 if new_token:
                     self._token_renewed = True
                     # Retry the request with the new token
-                    response = requests.get(url, headers=self.headers, params=params)
+                    response = requests.get(url, headers=self.headers, params=params, timeout=60)
                     self._debug_log(f"Retry response status: {response.status_code}")
 
             response.raise_for_status()
@@ -163,7 +163,7 @@ class ADOCommentFetcher:
         self._debug_log(f"Fetching PR info from: {url}")
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = requests.get(url, headers=self.headers, params=params, timeout=60)
             self._debug_log(f"PR info response status: {response.status_code}")
 
             response.raise_for_status()
@@ -390,7 +390,8 @@ Examples:
     args = parser.parse_args()
 
     # Get token from args, environment, keychain, or prompt
-    token = args.token
+    # (PR_REVIEW_TOKEN is how run_pr_review.py passes --token)
+    token = args.token or os.environ.get("PR_REVIEW_TOKEN")
     if not token:
         if TOKEN_RESOLVE_AVAILABLE:
             token, source = resolve_token(prompt_if_missing=True)
@@ -418,12 +419,11 @@ Examples:
         # Load status tracker
         status_tracker = create_status_tracker(
             args.pr,
-            project_root=working_dir
+            working_dir=working_dir
         )
         if status_tracker.statuses:
             if not args.debug:
-                status_location = "centralized" if status_tracker.use_centralized else "local"
-                print(f"[INFO] Loaded {len(status_tracker.statuses)} tracked statuses ({status_location})", file=sys.stderr)
+                print(f"[INFO] Loaded {len(status_tracker.statuses)} tracked statuses ({status_tracker.status_file})", file=sys.stderr)
 
         # Merge status info with threads
         threads = status_tracker.merge_with_threads(threads)
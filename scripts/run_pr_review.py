@@ -7,24 +7,73 @@ Platform-agnostic wrapper that routes to the appropriate PR fetcher
 """
 
 import argparse
-import json
+import codecs
 import os
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 
-# Import token manager and error messages from same directory
+# json, orjson, shutil and subprocess are imported where used: help and
+# early error exits never need them
+
+# Sibling modules are loaded from this directory by file path (see load_sibling)
 script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
 
-try:
-    from token_manager import resolve_token, resolve_github_token, KEYRING_AVAILABLE
-except ImportError:
-    # Fallback if token_manager not available
-    KEYRING_AVAILABLE = False
+# Sibling scripts launched as subprocesses
+FETCH_ADO_SCRIPT = str(script_dir / "fetch_pr_comments.py")
+FETCH_GITHUB_SCRIPT = str(script_dir / "fetch_github_pr.py")
+FETCH_CHANGED_FILES_SCRIPT = str(script_dir / "fetch_changed_files.py")
+COMMAND_RUNNER_SCRIPT = str(script_dir / "command_runner.py")
+
+
+def _detect_python_path():
+    """Prefer the current interpreter, then python3 or python in PATH."""
+    if sys.executable:
+        return sys.executable
+    import shutil
+    return shutil.which('python3') or shutil.which('python')
+
+
+PYTHON_PATH = _detect_python_path()
+
+# Written next to pr-review.json by --fast runs once the config has been validated
+VALIDATED_MARKER_NAME = ".pr-review.validated"
+
+# Required config fields per supported platform
+REQUIRED_FIELDS = {
+    'github': ('owner', 'repository'),
+    'azure-devops': ('organization', 'project', 'repository')
+}
+
+# Human-readable descriptions of where the token was resolved from
+_TOKEN_SOURCE_MESSAGES = {
+    'keychain': 'system keychain',
+    'prompt': 'user input',
+    'cli': 'command line argument'
+}
+GITHUB_TOKEN_SOURCE_MESSAGES = {
+    **_TOKEN_SOURCE_MESSAGES,
+    'env': 'environment variable (GITHUB_PAT)'
+}
+ADO_TOKEN_SOURCE_MESSAGES = {
+    **_TOKEN_SOURCE_MESSAGES,
+    'env': 'environment variable (AZURE_DEVOPS_PAT)',
+    'config': 'config file (consider migrating to keychain)'
+}
+
+
+class _FallbackTokenManager:
+    """Fallback if token_manager not available."""
+
+    @staticmethod
+    def find_project_root():
+        current = Path.cwd()
+        for directory in (current, *current.parents):
+            if os.path.lexists(directory / ".git"):
+                return directory
+        return None
 
-    def resolve_token(config=None, prompt_if_missing=True):  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def resolve_token(config=None, prompt_if_missing=True):
         token = os.getenv('AZURE_DEVOPS_PAT')
         if token:
             return (token, 'env')
@@ -32,33 +81,36 @@ except ImportError:
             return (config.get('token'), 'config')
         return (None, 'none')
 
-    def resolve_github_token(prompt_if_missing=True):  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def resolve_github_token(prompt_if_missing=True):
         token = os.getenv('GITHUB_PAT')
         if token:
             return (token, 'env')
         return (None, 'none')
 
-try:
-    from error_messages import (
-        config_missing_error, not_a_git_repo_error, token_invalid_error,
-        path_not_found_error, platform_missing_error
-    )
-except ImportError:
-    # Fallback if error_messages not available
-    def config_missing_error(project_root=None):  # pyright: ignore[reportRedeclaration]
+
+class _FallbackErrorMessages:
+    """Fallback if error_messages not available."""
+
+    @staticmethod
+    def config_missing_error(project_root=None):
         path = f"{project_root}/.claude/pr-review.json" if project_root else ".claude/pr-review.json"
         return f"ERROR: Configuration file not found at {path}"
 
-    def not_a_git_repo_error():  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def not_a_git_repo_error():
         return "ERROR: Not in a git repository. Please run this command from within a git project."
 
-    def token_invalid_error(reason):  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def token_invalid_error(reason):
         return f"ERROR: Invalid token - {reason}"
 
-    def path_not_found_error(path_type, path):  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def path_not_found_error(path_type, path):
         return f"ERROR: {path_type} not found at: {path}"
 
-    def platform_missing_error(project_root=None):  # pyright: ignore[reportRedeclaration]
+    @staticmethod
+    def platform_missing_error(project_root=None):
         return """ERROR: Missing 'platform' field in configuration.
 
 Please run the appropriate setup wizard:
@@ -66,42 +118,142 @@ Please run the appropriate setup wizard:
   - For Azure DevOps: python scripts/setup_ado.py"""
 
 
+_token_manager = None
+_error_messages = None
+_orjson = None
+
+
+def get_orjson():
+    """Import orjson on first use; returns None if the optional dependency is missing."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
+
+
+def load_sibling(name):
+    """
+    Load a module from this script's directory without adding it to sys.path.
+
+    Returns:
+        The module, or None if it is missing or fails to import
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    import importlib.util
+    module_path = script_dir / f"{name}.py"
+    if not module_path.is_file():
+        return None
+
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    if spec is None or spec.loader is None:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        del sys.modules[name]
+        return None
+    return module
+
+
+def get_token_manager():
+    """Import token_manager on first use (token resolution and the project root lookup)."""
+    global _token_manager
+    if _token_manager is None:
+        _token_manager = load_sibling('token_manager') or _FallbackTokenManager
+    return _token_manager
+
+
+def get_error_messages():
+    """Import error_messages on first use (only needed on failure paths)."""
+    global _error_messages
+    if _error_messages is None:
+        _error_messages = load_sibling('error_messages') or _FallbackErrorMessages
+    return _error_messages
+
+
+def dumps_compact(data) -> bytes:
+    """Serialize JSON for machine consumers (no indentation, compact separators)."""
+    orjson = get_orjson()
+    if orjson:
+        return orjson.dumps(data)
+    import json
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def parse_json_bytes(data):
+    """
+    Parse JSON from bytes (or str) without a text-decoding layer.
+
+    Returns:
+        Tuple of (parsed_data, error_message) - exactly one of them is None
+    """
+    orjson = get_orjson()
+    try:
+        if orjson:
+            return orjson.loads(data), None
+        import json
+        return json.loads(data), None
+    except ValueError as e:  # JSONDecodeError and UnicodeDecodeError
+        return None, str(e)
+
+
+def write_file_atomic(path: Path, data: bytes) -> bool:
+    """
+    Write data to path via a temp file and os.replace so readers never see a partial file.
+
+    Returns:
+        True if the file was written, False if it already had identical content
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass  # Missing or unreadable - (re)write it
+
+    import tempfile
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file 0600; give it the mode a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
 def find_script_path(platform: str = 'azure-devops'):
     """Auto-detect the appropriate fetch script relative to this script."""
     if platform == 'github':
-        return str(Path(__file__).parent / "fetch_github_pr.py")
+        return FETCH_GITHUB_SCRIPT
     else:
-        return str(Path(__file__).parent / "fetch_pr_comments.py")
+        return FETCH_ADO_SCRIPT
 
 
 def find_python_path():
     """Auto-detect Python interpreter."""
-    # First try current Python interpreter
-    if sys.executable:
-        return sys.executable
-
-    # Try to find python3 or python in PATH
-    python_cmd = shutil.which('python3') or shutil.which('python')
-    if python_cmd:
-        return python_cmd
-
-    return None
+    return PYTHON_PATH
 
 
 def find_project_root():
     """Find the project root by searching upward for a .git folder."""
-    current = Path.cwd()
-
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-
-    # Check root directory as well
-    if (current / ".git").exists():
-        return current
-
-    return None
+    return get_token_manager().find_project_root()
 
 
 def find_config_file():
@@ -119,35 +271,56 @@ def find_config_file():
     return None, project_root
 
 
-def load_config(config_path, project_root=None):
-    """Load and validate configuration for any platform."""
+def config_digest(raw: bytes) -> str:
+    """Content hash of the raw config bytes, stored in the validated marker."""
+    import hashlib
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def load_config(config_path, project_root=None, fast=False):
+    """
+    Load and validate configuration for any platform.
+
+    With fast=True, validation is skipped when the config content matches the
+    hash recorded in the validated marker by a previous successful fast run.
+    """
+    marker_path = Path(config_path).parent / VALIDATED_MARKER_NAME
     try:
-        # Try utf-8-sig first to handle BOM, fallback to utf-8
-        try:
-            with open(config_path, 'r', encoding='utf-8-sig') as f:
-                config = json.load(f)
-        except UnicodeDecodeError:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+        # Read once and strip a UTF-8 BOM (written by some Windows editors) if present
+        raw = Path(config_path).read_bytes()
+        if raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        config, parse_error = parse_json_bytes(raw)
+        if parse_error:
+            print(f"ERROR: Invalid JSON in config file: {parse_error}", file=sys.stderr)
+            return None
+
+        if fast:
+            digest = config_digest(raw)
+            try:
+                if marker_path.read_text(encoding='utf-8') == digest:
+                    # Known-good config: fill in defaults without re-validating
+                    if not config.get('scriptPath'):
+                        config['scriptPath'] = find_script_path(config['platform'])
+                    if not config.get('pythonPath'):
+                        config['pythonPath'] = find_python_path()
+                    return config
+            except OSError:
+                pass  # No marker yet
 
         # Check for platform field (required)
         platform = config.get('platform')
         if not platform:
-            print(platform_missing_error(project_root), file=sys.stderr)
+            print(get_error_messages().platform_missing_error(project_root), file=sys.stderr)
             return None
 
         # Validate platform value
-        if platform not in ['github', 'azure-devops']:
+        if platform not in REQUIRED_FIELDS:
             print(f"ERROR: Invalid platform '{platform}'. Must be 'github' or 'azure-devops'", file=sys.stderr)
             return None
 
         # Validate required fields based on platform
-        if platform == 'github':
-            required = ['owner', 'repository']
-        else:  # azure-devops
-            required = ['organization', 'project', 'repository']
-
-        missing = [field for field in required if field not in config or not config[field]]
+        missing = [field for field in REQUIRED_FIELDS[platform] if not config.get(field)]
 
         if missing:
             print(f"ERROR: Missing required fields for {platform} in config: {', '.join(missing)}", file=sys.stderr)
@@ -167,68 +340,83 @@ def load_config(config_path, project_root=None):
                 return None
 
         # Validate paths exist (if explicitly provided, validate them)
-        if config.get('pythonPath') and not Path(config['pythonPath']).exists():
-            print(path_not_found_error('Python', config['pythonPath']), file=sys.stderr)
+        if config.get('pythonPath') and not os.path.exists(config['pythonPath']):
+            print(get_error_messages().path_not_found_error('Python', config['pythonPath']), file=sys.stderr)
             return None
 
-        if config.get('scriptPath') and not Path(config['scriptPath']).exists():
-            print(path_not_found_error('Script', config['scriptPath']), file=sys.stderr)
+        if config.get('scriptPath') and not os.path.exists(config['scriptPath']):
+            print(get_error_messages().path_not_found_error('Script', config['scriptPath']), file=sys.stderr)
             return None
 
         # Token resolution is handled separately in main() using token_manager
         # We don't validate token here anymore - it's done via resolve_token()
 
+        if fast:
+            try:
+                marker_path.write_text(digest, encoding='utf-8')
+            except OSError as e:
+                print(f"[WARNING] Could not write validated marker: {e}", file=sys.stderr)
+
         return config
 
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON in config file: {e}", file=sys.stderr)
-        return None
     except Exception as e:
         print(f"ERROR: Failed to read config: {e}", file=sys.stderr)
         return None
 
 
-def run_ado_fetch_script(config, pr_number, output_file, token):
-    """Execute the Azure DevOps fetch_pr_comments.py script."""
-    cmd = [
-        config['pythonPath'],
-        config['scriptPath'],
-        '--org', config['organization'],
-        '--project', config['project'],
-        '--repo', config['repository'],
-        '--pr', str(pr_number),
-        '--token', token,
-        '--output', str(output_file)
-    ]
+def token_env(token):
+    """
+    Child process environment carrying the token.
+
+    The token is passed via the environment rather than argv so it does not
+    show up in process listings. PR_REVIEW_TOKEN is read by the child scripts
+    the way --token was, without the checks applied to AZURE_DEVOPS_PAT or
+    GITHUB_PAT, so the token chosen here is always the one used.
+    """
+    return {**os.environ, 'PR_REVIEW_TOKEN': token}
+
+
+def execute_fetch_command(config, cmd, env):
+    """Run a fetch script command line, returning True on success."""
+    import subprocess
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        # Stream the script's progress straight to the terminal instead of buffering it;
+        # its stdout goes to our stderr so stdout stays reserved for the output file path.
+        # No wall-clock timeout: the script bounds its own HTTP requests and may be
+        # waiting on the user to enter a renewed token.
+        sys.stderr.flush()
+        result = subprocess.run(cmd, stdout=sys.stderr, env=env)
 
         if result.returncode != 0:
             print(f"ERROR: Script failed with code {result.returncode}", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
             return False
 
-        # Print any output from the script
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
         return True
 
-    except subprocess.TimeoutExpired:
-        print("ERROR: Script timed out after 60 seconds", file=sys.stderr)
+    except FileNotFoundError:
+        # Paths are not re-validated in --fast mode, so the interpreter may have moved
+        print(get_error_messages().path_not_found_error('Python', config['pythonPath']), file=sys.stderr)
         return False
     except Exception as e:
         print(f"ERROR: Failed to execute script: {e}", file=sys.stderr)
         return False
 
 
+def run_ado_fetch_script(config, pr_number, output_file, token):
+    """Execute the Azure DevOps fetch_pr_comments.py script."""
+    cmd = [
+        config['pythonPath'],
+        config['scriptPath'],
+        '--org', config['organization'],
+        '--project', config['project'],
+        '--repo', config['repository'],
+        '--pr', str(pr_number),
+        '--output', os.fspath(output_file)
+    ]
+    return execute_fetch_command(config, cmd, token_env(token))
+
+
 def run_github_fetch_script(config, pr_number, output_file, token):
     """Execute the GitHub fetch_github_pr.py script."""
     cmd = [
@@ -237,36 +425,9 @@ def run_github_fetch_script(config, pr_number, output_file, token):
         '--owner', config['owner'],
         '--repo', config['repository'],
         '--pr', str(pr_number),
-        '--token', token,
-        '--output', str(output_file)
+        '--output', os.fspath(output_file)
     ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode != 0:
-            print(f"ERROR: Script failed with code {result.returncode}", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            return False
-
-        # Print any output from the script
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
-        return True
-
-    except subprocess.TimeoutExpired:
-        print("ERROR: Script timed out after 60 seconds", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"ERROR: Failed to execute script: {e}", file=sys.stderr)
-        return False
+    return execute_fetch_command(config, cmd, token_env(token))
 
 
 def run_fetch_script(config, pr_number, output_file, token):
@@ -281,11 +442,12 @@ def run_fetch_script(config, pr_number, output_file, token):
 
 def run_fetch_changed_files(config, pr_number, token, project_root):
     """Execute fetch_changed_files.py and return the results."""
-    script_path = Path(__file__).parent / "fetch_changed_files.py"
+    import subprocess
+
     python_path = config.get('pythonPath', sys.executable)
     platform = config.get('platform', 'azure-devops')
 
-    cmd = [python_path, str(script_path), '--pr', str(pr_number), '--token', token]
+    cmd = [python_path, FETCH_CHANGED_FILES_SCRIPT, '--pr', str(pr_number)]
 
     if platform == 'github':
         cmd.extend(['--platform', 'github', '--owner', config['owner'], '--repo', config['repository']])
@@ -294,19 +456,20 @@ def run_fetch_changed_files(config, pr_number, token, project_root):
                     '--project', config['project'], '--repo', config['repository']])
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = subprocess.run(cmd, capture_output=True, timeout=60, env=token_env(token))
         if result.returncode != 0:
-            print(f"[WARNING] Failed to fetch changed files: {result.stderr}", file=sys.stderr)
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            print(f"[WARNING] Failed to fetch changed files: {stderr}", file=sys.stderr)
             return None
 
         # Parse JSON output (stdout contains the JSON, stderr has info messages)
-        return json.loads(result.stdout)
+        changed_files_data, parse_error = parse_json_bytes(result.stdout)
+        if parse_error:
+            print(f"[WARNING] Failed to parse changed files output: {parse_error}", file=sys.stderr)
+        return changed_files_data
     except subprocess.TimeoutExpired:
         print("[WARNING] Fetch changed files timed out", file=sys.stderr)
         return None
-    except json.JSONDecodeError as e:
-        print(f"[WARNING] Failed to parse changed files output: {e}", file=sys.stderr)
-        return None
     except Exception as e:
         print(f"[WARNING] Error fetching changed files: {e}", file=sys.stderr)
         return None
@@ -314,31 +477,36 @@ def run_fetch_changed_files(config, pr_number, token, project_root):
 
 def run_command_runner(config, changed_files_data, project_root):
     """Execute command_runner.py and return the execution plan."""
-    script_path = Path(__file__).parent / "command_runner.py"
+    import subprocess
+
     python_path = config.get('pythonPath', sys.executable)
     config_path = project_root / ".claude" / "pr-review.json"
 
     # Write changed files to temp file
     import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
-        json.dump(changed_files_data, f)
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+        f.write(dumps_compact(changed_files_data))
         temp_file = f.name
 
     try:
         cmd = [
-            python_path, str(script_path),
-            '--config', str(config_path),
-            '--project-root', str(project_root),
+            python_path, COMMAND_RUNNER_SCRIPT,
+            '--config', os.fspath(config_path),
+            '--project-root', os.fspath(project_root),
             '--changed-files', temp_file
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
 
         if result.returncode != 0:
-            print(f"[WARNING] Command runner failed: {result.stderr}", file=sys.stderr)
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            print(f"[WARNING] Command runner failed: {stderr}", file=sys.stderr)
             return None
 
-        return json.loads(result.stdout)
+        command_plan, parse_error = parse_json_bytes(result.stdout)
+        if parse_error:
+            print(f"[WARNING] Failed to parse command runner output: {parse_error}", file=sys.stderr)
+        return command_plan
     except Exception as e:
         print(f"[WARNING] Error running command runner: {e}", file=sys.stderr)
         return None
@@ -350,31 +518,37 @@ def run_command_runner(config, changed_files_data, project_root):
             pass
 
 
+def read_command_file(cmd_path):
+    """Read a command file, returning (content, error)."""
+    try:
+        with open(cmd_path, 'r', encoding='utf-8') as f:
+            return f.read(), None
+    except FileNotFoundError:
+        return None, "File not found"
+    except Exception as e:
+        return f"[ERROR] Failed to read: {e}", str(e)
+
+
 def enrich_command_plan_with_content(command_plan, project_root):
     """Read command file contents and add them to the execution plan."""
     if not command_plan or not command_plan.get('enabled'):
         return command_plan
 
     commands = command_plan.get('commands', [])
-    enriched_commands = []
+    if not commands:
+        return command_plan
 
-    for cmd in commands:
-        cmd_path = Path(cmd.get('path', ''))
-        if cmd_path.exists():
-            try:
-                with open(cmd_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                cmd['content'] = content
-            except Exception as e:
-                cmd['content'] = f"[ERROR] Failed to read: {e}"
-                cmd['contentError'] = str(e)
-        else:
-            cmd['content'] = None
-            cmd['contentError'] = "File not found"
+    # Command files are small and independent - read them concurrently
+    from concurrent.futures import ThreadPoolExecutor
+    paths = [cmd.get('path', '') for cmd in commands]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        results = list(executor.map(read_command_file, paths))
 
-        enriched_commands.append(cmd)
+    for cmd, (content, error) in zip(commands, results):
+        cmd['content'] = content
+        if error:
+            cmd['contentError'] = error
 
-    command_plan['commands'] = enriched_commands
     return command_plan
 
 
@@ -411,7 +585,7 @@ def generate_full_output(pr_number, config, project_root, token, changed_files_d
     return output
 
 
-def main():
+def main() -> int:
     parser = argparse.ArgumentParser(
         description='PR Review Wrapper - Fetches PR comments from Azure DevOps or GitHub'
     )
@@ -425,6 +599,8 @@ def main():
         help='Run commands only, skip PR comment fetching')
     parser.add_argument('--json', action='store_true',
         help='Output everything as single JSON (for Claude automation)')
+    parser.add_argument('--fast', action='store_true',
+        help='Skip config validation when the config is unchanged since the last validated --fast run')
 
     args = parser.parse_args()
 
@@ -443,23 +619,22 @@ def main():
         config_path, project_root = find_config_file()
         # Check if we're in a git repository (only required when auto-discovering config)
         if not project_root:
-            print(not_a_git_repo_error(), file=sys.stderr)
-            sys.exit(1)
+            print(get_error_messages().not_a_git_repo_error(), file=sys.stderr)
+            return 1
 
     if not config_path or not config_path.exists():
-        print(config_missing_error(project_root), file=sys.stderr)
-        sys.exit(1)
+        print(get_error_messages().config_missing_error(project_root), file=sys.stderr)
+        return 1
 
     print(f"[INFO] Loading configuration from {config_path}", file=sys.stderr)
-    config = load_config(config_path, project_root)
+    config = load_config(config_path, project_root, fast=args.fast)
 
     if not config:
-        sys.exit(1)
+        return 1
 
     # Get platform from config
     platform = config.get('platform', 'azure-devops')
-    print(f"[INFO] Platform: {platform}", file=sys.stderr)
-    print("[SUCCESS] Configuration validated", file=sys.stderr)
+    print(f"[INFO] Platform: {platform}\n[SUCCESS] Configuration validated", file=sys.stderr)
 
     # Resolve token using layered approach based on platform
     if args.token:
@@ -469,31 +644,17 @@ def main():
     else:
         # Use token_manager for layered resolution based on platform
         if platform == 'github':
-            token, token_source = resolve_github_token(prompt_if_missing=True)
+            token, token_source = get_token_manager().resolve_github_token(prompt_if_missing=True)
         else:
-            token, token_source = resolve_token(config, prompt_if_missing=True)
+            token, token_source = get_token_manager().resolve_token(config, prompt_if_missing=True)
 
     if not token:
         env_var = 'GITHUB_PAT' if platform == 'github' else 'AZURE_DEVOPS_PAT'
-        print(token_invalid_error(f"No token found or provided. Set {env_var} or use --token"), file=sys.stderr)
-        sys.exit(1)
+        print(get_error_messages().token_invalid_error(f"No token found or provided. Set {env_var} or use --token"), file=sys.stderr)
+        return 1
 
     # Log token source (but not the token itself)
-    if platform == 'github':
-        source_messages = {
-            'env': 'environment variable (GITHUB_PAT)',
-            'keychain': 'system keychain',
-            'prompt': 'user input',
-            'cli': 'command line argument'
-        }
-    else:
-        source_messages = {
-            'env': 'environment variable (AZURE_DEVOPS_PAT)',
-            'keychain': 'system keychain',
-            'config': 'config file (consider migrating to keychain)',
-            'prompt': 'user input',
-            'cli': 'command line argument'
-        }
+    source_messages = GITHUB_TOKEN_SOURCE_MESSAGES if platform == 'github' else ADO_TOKEN_SOURCE_MESSAGES
     print(f"[INFO] Using token from: {source_messages.get(token_source, token_source)}", file=sys.stderr)
 
     # Determine output file
@@ -517,8 +678,17 @@ def main():
         if changed_files_data:
             print(f"[INFO] Found {changed_files_data.get('totalFiles', 0)} changed files", file=sys.stderr)
 
-            # Get command execution plan
-            command_plan = run_command_runner(config, changed_files_data, project_root)
+            # Get command execution plan (no need to spawn the runner for an empty PR)
+            if changed_files_data.get('totalFiles', 0) == 0:
+                command_plan = {
+                    "enabled": False,
+                    "reason": "No changed files",
+                    "commands": [],
+                    "totalCommands": 0,
+                    "totalFiles": 0
+                }
+            else:
+                command_plan = run_command_runner(config, changed_files_data, project_root)
 
             if command_plan and command_plan.get('enabled'):
                 total_commands = command_plan.get('totalCommands', 0)
@@ -530,8 +700,7 @@ def main():
 
                 # Output command plan for the workflow to use
                 command_plan_file = Path.cwd() / f"pr-{args.pr_number}-commands.json"
-                with open(command_plan_file, 'w', encoding='utf-8') as f:
-                    json.dump(command_plan, f, indent=2)
+                write_file_atomic(command_plan_file, dumps_compact(command_plan))
                 print(f"[COMMANDS] {command_plan_file}", file=sys.stderr)
         else:
             print("[WARNING] Could not fetch changed files, skipping commands", file=sys.stderr)
@@ -540,10 +709,10 @@ def main():
     if args.commands_only:
         if command_plan and command_plan.get('enabled'):
             print(f"[SUCCESS] Command plan saved to: pr-{args.pr_number}-commands.json", file=sys.stderr)
-            sys.exit(0)
+            return 0
         else:
             print("[INFO] No commands to execute", file=sys.stderr)
-            sys.exit(0)
+            return 0
 
     # If --json mode, output full structured data and exit
     if args.json:
@@ -551,8 +720,10 @@ def main():
             args.pr_number, config, project_root, token,
             changed_files_data, command_plan, output_file
         )
-        print(json.dumps(full_output, indent=2))
-        sys.exit(0)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dumps_compact(full_output) + b'\n')
+        sys.stdout.flush()
+        return 0
 
     if platform == 'github':
         print(f"[INFO] Fetching PR #{args.pr_number} from GitHub...", file=sys.stderr)
@@ -565,10 +736,10 @@ def main():
     if success:
         print(f"[SUCCESS] Output saved to: {output_file}", file=sys.stderr)
         print(str(output_file))  # Output the file path to stdout for parsing
-        sys.exit(0)
+        return 0
     else:
-        sys.exit(1)
+        return 1
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
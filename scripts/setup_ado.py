@@ -8,11 +8,10 @@ For GitHub setup, use setup_github.py instead.
 
 import json
 import os
-import shutil
-import subprocess
+import re
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 # Import from same directory
 script_dir = Path(__file__).parent
@@ -30,21 +29,12 @@ except ImportError:
     def get_token_from_keychain():
         return None
 
+# Shared .git walk, cached per directory
+from token_manager import find_project_root
 
-def find_project_root() -> Optional[Path]:
-    """Find the project root by searching upward for a .git folder."""
-    current = Path.cwd()
 
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-
-    # Check root directory as well
-    if (current / ".git").exists():
-        return current
-
-    return None
+# Azure DevOps organization names: letters, digits, '.', '_' and '-'
+ORG_NAME_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
 
 
 # ANSI color codes (work on most terminals)
@@ -74,31 +64,38 @@ if not sys.stdout.isatty():
     Colors.disable()
 
 
+# Message formats, built once now that the color setting is final
+_HEADER_RULE = f"{Colors.CYAN}{'=' * 50}{Colors.END}"
+_HEADER_FORMAT = f"\n{_HEADER_RULE}\n{Colors.CYAN}  {{}}{Colors.END}\n{_HEADER_RULE}\n"
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓{Colors.END} "
+_ERROR_PREFIX = f"{Colors.RED}✗{Colors.END} "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠{Colors.END} "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ{Colors.END} "
+
+
 def print_header(text: str):
     """Print a section header."""
-    print(f"\n{Colors.CYAN}{'=' * 50}{Colors.END}")
-    print(f"{Colors.CYAN}  {text}{Colors.END}")
-    print(f"{Colors.CYAN}{'=' * 50}{Colors.END}\n")
+    print(_HEADER_FORMAT.format(text))
 
 
 def print_success(text: str):
     """Print a success message."""
-    print(f"{Colors.GREEN}✓{Colors.END} {text}")
+    print(_SUCCESS_PREFIX + text)
 
 
 def print_error(text: str):
     """Print an error message."""
-    print(f"{Colors.RED}✗{Colors.END} {text}")
+    print(_ERROR_PREFIX + text)
 
 
 def print_warning(text: str):
     """Print a warning message."""
-    print(f"{Colors.YELLOW}⚠{Colors.END} {text}")
+    print(_WARNING_PREFIX + text)
 
 
 def print_info(text: str):
     """Print an info message."""
-    print(f"{Colors.BLUE}ℹ{Colors.END} {text}")
+    print(_INFO_PREFIX + text)
 
 
 def detect_python() -> Tuple[Optional[str], str]:
@@ -108,44 +105,25 @@ def detect_python() -> Tuple[Optional[str], str]:
     Returns:
         Tuple of (path, version_string)
     """
-    # Try current Python interpreter
-    python_path = sys.executable
-    if python_path:
-        try:
-            result = subprocess.run(
-                [python_path, '--version'],
-                capture_output=True, text=True, timeout=5
-            )
-            version = result.stdout.strip() or result.stderr.strip()
-            return (python_path, version)
-        except Exception:
-            pass
-
-    # Try python3 in PATH
-    python_cmd = shutil.which('python3')
-    if python_cmd:
-        try:
-            result = subprocess.run(
-                [python_cmd, '--version'],
-                capture_output=True, text=True, timeout=5
-            )
-            version = result.stdout.strip() or result.stderr.strip()
-            return (python_cmd, version)
-        except Exception:
-            pass
-
-    # Try python in PATH
-    python_cmd = shutil.which('python')
-    if python_cmd:
-        try:
-            result = subprocess.run(
-                [python_cmd, '--version'],
-                capture_output=True, text=True, timeout=5
-            )
-            version = result.stdout.strip() or result.stderr.strip()
-            return (python_cmd, version)
-        except Exception:
-            pass
+    # The current interpreter reports its own version without a subprocess
+    if sys.executable:
+        return (sys.executable, "Python {}.{}.{}".format(*sys.version_info[:3]))
+
+    # Try python3, then python in PATH
+    import shutil
+    import subprocess
+    for name in ('python3', 'python'):
+        python_cmd = shutil.which(name)
+        if python_cmd:
+            try:
+                # Python 2 prints its version to stderr, so merge it into stdout
+                version = subprocess.check_output(
+                    [python_cmd, '--version'],
+                    stderr=subprocess.STDOUT, text=True, timeout=5
+                ).strip()
+                return (python_cmd, version)
+            except Exception:
+                pass
 
     return (None, "Not found")
 
@@ -157,16 +135,16 @@ def check_dependencies() -> bool:
     Returns:
         True if all dependencies are available
     """
+    # find_spec locates the packages without executing them (importing
+    # requests alone pulls in urllib3, charset-normalizer and certifi)
+    from importlib.util import find_spec
+
     missing = []
 
-    try:
-        import requests
-    except ImportError:
+    if find_spec('requests') is None:
         missing.append('requests')
 
-    try:
-        from dotenv import load_dotenv
-    except ImportError:
+    if find_spec('dotenv') is None:
         missing.append('python-dotenv')
 
     if missing:
@@ -177,6 +155,40 @@ def check_dependencies() -> bool:
     return True
 
 
+# Azure DevOps REST endpoint used to validate a PAT; $top=1 keeps the
+# response small for organizations with many projects
+ADO_HOST = "dev.azure.com"
+ADO_PROJECTS_PATH = "/{org}/_apis/projects?api-version=7.1&$top=1"
+
+_ado_connection = None
+
+
+def get_ado_connection():
+    """
+    Get the shared HTTPS connection to Azure DevOps, creating it on first use.
+
+    Reusing one keep-alive connection means repeated token checks pay for
+    the TLS handshake only once.
+
+    Returns:
+        http.client.HTTPSConnection to dev.azure.com
+    """
+    global _ado_connection
+    if _ado_connection is None:
+        import http.client
+        import ssl
+        # Verify against certifi's bundle when it is installed (it comes with
+        # requests), as requests did; Python builds without system CAs
+        # (python.org macOS without "Install Certificates") need it
+        try:
+            import certifi
+            context = ssl.create_default_context(cafile=certifi.where())
+        except ImportError:
+            context = ssl.create_default_context()
+        _ado_connection = http.client.HTTPSConnection(ADO_HOST, timeout=10, context=context)
+    return _ado_connection
+
+
 def test_token(org: str, token: str) -> bool:
     """
     Test if the PAT token is valid.
@@ -188,44 +200,92 @@ def test_token(org: str, token: str) -> bool:
     Returns:
         True if token is valid
     """
-    import base64
-
-    try:
-        import requests
-    except ImportError:
-        print_warning("Cannot test token - requests library not installed")
-        return True  # Assume valid
+    import binascii
+    import http.client
+    import socket
+    import ssl
+    from urllib.parse import quote
 
     credentials = f":{token}"
-    auth_header = base64.b64encode(credentials.encode()).decode()
+    auth_header = binascii.b2a_base64(credentials.encode(), newline=False).decode('ascii')
 
-    url = f"https://dev.azure.com/{org}/_apis/projects?api-version=7.1"
+    path = ADO_PROJECTS_PATH.format(org=quote(org))
     headers = {
         "Authorization": f"Basic {auth_header}",
         "Content-Type": "application/json"
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
+        conn = get_ado_connection()
+        # A kept-alive connection may have been dropped by the server since
+        # the last check; retry once on a fresh socket in that case
+        status = None
+        for attempt in range(2):
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                response.read()  # drain so the connection can be reused
+                status = response.status
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+        if status == 200:
             return True
-        elif response.status_code == 401:
+        elif status == 401:
             print_error("Token authentication failed")
             return False
-        elif response.status_code == 403:
+        elif status == 403:
             print_error("Token lacks permissions")
             return False
         else:
-            print_warning(f"Unexpected response: {response.status_code}")
+            print_warning(f"Unexpected response: {status}")
             return False
-    except requests.exceptions.Timeout:
+    except socket.timeout:
         print_warning("Connection timed out - could not verify token")
         return True  # Assume valid
-    except requests.exceptions.RequestException as e:
+    except ssl.SSLCertVerificationError as e:
+        # Not a network blip: the CA store could not verify dev.azure.com,
+        # so the token was never actually checked
+        print_error(f"TLS certificate verification failed: {e}")
+        print_info("Check the system CA certificates (or SSL_CERT_FILE) and re-run the check")
+        return False
+    except (OSError, http.client.HTTPException) as e:
         print_warning(f"Connection error: {e}")
         return True  # Assume valid
 
 
+def read_line(prompt: str) -> str:
+    """
+    Read one line of user input.
+
+    Piped answers (non-interactive runs) are read straight from stdin;
+    input() is kept for terminals so line editing still works.
+
+    Args:
+        prompt: Prompt text, written without a trailing newline
+
+    Returns:
+        The line without its line ending
+
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\r\n')
+
+
 def get_input(prompt: str, default: Optional[str] = None) -> str:
     """
     Get input from user with optional default.
@@ -243,13 +303,66 @@ def get_input(prompt: str, default: Optional[str] = None) -> str:
         display_prompt = f"{prompt}: "
 
     try:
-        value = input(display_prompt).strip()
+        value = read_line(display_prompt).strip()
         return value if value else (default or "")
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         sys.exit(1)
 
 
+def get_required_input(prompt: str, name: str,
+                       validate: Optional[Callable[[str], Optional[str]]] = None) -> str:
+    """
+    Prompt until a non-empty (and, if given, valid) value is entered.
+
+    Args:
+        prompt: Prompt text
+        name: Field name used in the "is required" error
+        validate: Optional function returning the cleaned value, or None
+                  (after printing its own error) to prompt again
+
+    Returns:
+        User input
+    """
+    while True:
+        value = get_input(prompt)
+        if not value:
+            print_error(f"{name} is required")
+            continue
+        if validate:
+            value = validate(value)
+            if not value:
+                continue
+        return value
+
+
+def normalize_organization(value: str) -> Optional[str]:
+    """
+    Accept an organization name or a pasted Azure DevOps URL.
+
+    Args:
+        value: User input, e.g. 'contoso', 'https://dev.azure.com/contoso/Project'
+               or 'contoso.visualstudio.com'
+
+    Returns:
+        Organization name, or None if the input is not a valid name
+    """
+    if 'dev.azure.com' in value or '.visualstudio.com' in value:
+        from urllib.parse import urlparse
+        parsed = urlparse(value if '://' in value else f"https://{value}")
+        host = parsed.hostname or ''
+        if host == 'dev.azure.com':
+            value = parsed.path.strip('/').split('/')[0]
+        elif host.endswith('.visualstudio.com'):
+            value = host[:-len('.visualstudio.com')]
+
+    if not ORG_NAME_PATTERN.match(value):
+        print_error(f"Invalid organization name: '{value}'")
+        return None
+
+    return value
+
+
 def get_secure_input(prompt: str) -> str:
     """
     Get password-style input (hidden).
@@ -281,7 +394,7 @@ def get_yes_no(prompt: str, default: bool = True) -> bool:
     """
     default_str = "Y/n" if default else "y/N"
     try:
-        response = input(f"{prompt} ({default_str}): ").strip().lower()
+        response = read_line(f"{prompt} ({default_str}): ").strip().lower()
         if not response:
             return default
         return response in ['y', 'yes']
@@ -335,8 +448,14 @@ def create_config_file(org: str, project: str, repo: str, project_root: Optional
         "autoFormatForClaudeCode": True
     }
 
-    with open(config_file, 'w', encoding='utf-8') as f:
+    # Write to a temp file and rename so an interrupted write never leaves a truncated config
+    # (indented, since this file is meant to be read and edited by people)
+    temp_file = config_file.with_name(config_file.name + ".tmp")
+    with open(temp_file, 'w', encoding='utf-8') as f:
         json.dump(config, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, config_file)
 
     return config_file, project_root
 
@@ -370,15 +489,18 @@ def run_wizard():
             requirements_file = script_dir / "requirements.txt"
             if requirements_file.exists():
                 print_info("Installing dependencies...")
-                result = subprocess.run(
-                    [python_path, '-m', 'pip', 'install', '-r', str(requirements_file)],
-                    capture_output=True, text=True
-                )
+                import subprocess
+                # pip's errors go straight to the terminal instead of being buffered
+                sys.stdout.flush()
+                result = subprocess.run([
+                    python_path, '-m', 'pip', 'install',
+                    '--disable-pip-version-check', '--no-input', '--prefer-binary', '--quiet',
+                    '-r', str(requirements_file)
+                ])
                 if result.returncode == 0:
                     print_success("Dependencies installed")
                 else:
                     print_error("Failed to install dependencies")
-                    print(result.stderr)
             else:
                 print_error(f"requirements.txt not found at {requirements_file}")
 
@@ -386,20 +508,9 @@ def run_wizard():
     print_header("Step 3: Azure DevOps Configuration")
     print("Enter your Azure DevOps details:\n")
 
-    org = get_input("Organization name (e.g., 'contoso')")
-    while not org:
-        print_error("Organization is required")
-        org = get_input("Organization name")
-
-    project = get_input("Project name")
-    while not project:
-        print_error("Project is required")
-        project = get_input("Project name")
-
-    repo = get_input("Repository name")
-    while not repo:
-        print_error("Repository is required")
-        repo = get_input("Repository name")
+    org = get_required_input("Organization name (e.g., 'contoso')", "Organization", normalize_organization)
+    project = get_required_input("Project name", "Project")
+    repo = get_required_input("Repository name", "Repository")
 
     # Step 4: Token configuration
     print_header("Step 4: Authentication Token (PAT)")
@@ -461,28 +572,34 @@ def run_wizard():
 
     # Summary
     print_header("Setup Complete!")
-    print("Your configuration:")
-    print(f"  Organization: {org}")
-    print(f"  Project: {project}")
-    print(f"  Repository: {repo}")
-    print(f"  Project root: {project_root}")
-    print(f"  Config file: {config_file}")
-    print("")
+    # Emitted as one block rather than a print per line
+    lines = [
+        "Your configuration:",
+        f"  Organization: {org}",
+        f"  Project: {project}",
+        f"  Repository: {repo}",
+        f"  Project root: {project_root}",
+        f"  Config file: {config_file}",
+        "",
+    ]
 
     if token_source == 'env':
-        print_info("Token: Using environment variable (AZURE_DEVOPS_PAT)")
+        lines.append(_INFO_PREFIX + "Token: Using environment variable (AZURE_DEVOPS_PAT)")
     elif KEYRING_AVAILABLE:
-        print_info("Token: Stored in system keychain")
+        lines.append(_INFO_PREFIX + "Token: Stored in system keychain")
     else:
-        print_warning("Token: Not stored (set AZURE_DEVOPS_PAT or install keyring)")
-        print_info("  pip install keyring")
-        print_info("  python scripts/token_manager.py --save")
+        lines.append(_WARNING_PREFIX + "Token: Not stored (set AZURE_DEVOPS_PAT or install keyring)")
+        lines.append(_INFO_PREFIX + "  pip install keyring")
+        lines.append(_INFO_PREFIX + "  python scripts/token_manager.py --save")
 
-    print("")
-    print("Next steps:")
-    print(f"  1. Start Claude Code: {Colors.BLUE}claude{Colors.END}")
-    print(f"  2. Run the command: {Colors.BLUE}/pr-review 12345{Colors.END}")
-    print("")
+    lines += [
+        "",
+        "Next steps:",
+        f"  1. Start Claude Code: {Colors.BLUE}claude{Colors.END}",
+        f"  2. Run the command: {Colors.BLUE}/pr-review 12345{Colors.END}",
+        "",
+    ]
+    print("\n".join(lines))
 
 
 def main():
@@ -531,12 +648,11 @@ Run without arguments for interactive mode.
         if config_file.exists():
             print_success(f"Config file: {config_file}")
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                print(f"  Organization: {config.get('organization', 'Not set')}")
-                print(f"  Project: {config.get('project', 'Not set')}")
-                print(f"  Repository: {config.get('repository', 'Not set')}")
-            except Exception as e:
+                config = json.loads(config_file.read_bytes())
+                print(f"  Organization: {config.get('organization', 'Not set')}\n"
+                      f"  Project: {config.get('project', 'Not set')}\n"
+                      f"  Repository: {config.get('repository', 'Not set')}")
+            except (OSError, ValueError, AttributeError) as e:
                 print_error(f"Failed to read config: {e}")
         else:
             print_error(f"Config file not found at {config_file}")
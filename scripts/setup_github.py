@@ -28,21 +28,8 @@ except ImportError:
     def get_github_token_from_keychain():
         return None
 
-
-def find_project_root() -> Optional[Path]:
-    """Find the project root by searching upward for a .git folder."""
-    current = Path.cwd()
-
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-
-    # Check root directory as well
-    if (current / ".git").exists():
-        return current
-
-    return None
+# Shared .git walk, cached per directory
+from token_manager import find_project_root
 
 
 # ANSI color codes (work on most terminals)
@@ -72,31 +59,38 @@ if not sys.stdout.isatty():
     Colors.disable()
 
 
+# Message formats, built once now that the color setting is final
+_HEADER_RULE = f"{Colors.CYAN}{'=' * 50}{Colors.END}"
+_HEADER_FORMAT = f"\n{_HEADER_RULE}\n{Colors.CYAN}  {{}}{Colors.END}\n{_HEADER_RULE}\n"
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓{Colors.END} "
+_ERROR_PREFIX = f"{Colors.RED}✗{Colors.END} "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠{Colors.END} "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ{Colors.END} "
+
+
 def print_header(text: str):
     """Print a section header."""
-    print(f"\n{Colors.CYAN}{'=' * 50}{Colors.END}")
-    print(f"{Colors.CYAN}  {text}{Colors.END}")
-    print(f"{Colors.CYAN}{'=' * 50}{Colors.END}\n")
+    print(_HEADER_FORMAT.format(text))
 
 
 def print_success(text: str):
     """Print a success message."""
-    print(f"{Colors.GREEN}✓{Colors.END} {text}")
+    print(_SUCCESS_PREFIX + text)
 
 
 def print_error(text: str):
     """Print an error message."""
-    print(f"{Colors.RED}✗{Colors.END} {text}")
+    print(_ERROR_PREFIX + text)
 
 
 def print_warning(text: str):
     """Print a warning message."""
-    print(f"{Colors.YELLOW}⚠{Colors.END} {text}")
+    print(_WARNING_PREFIX + text)
 
 
 def print_info(text: str):
     """Print an info message."""
-    print(f"{Colors.BLUE}ℹ{Colors.END} {text}")
+    print(_INFO_PREFIX + text)
 
 
 def check_dependencies() -> bool:
@@ -106,11 +100,13 @@ def check_dependencies() -> bool:
     Returns:
         True if all dependencies are available
     """
+    # find_spec locates the package without executing it (importing
+    # requests alone pulls in urllib3, charset-normalizer and certifi)
+    from importlib.util import find_spec
+
     missing = []
 
-    try:
-        import requests
-    except ImportError:
+    if find_spec('requests') is None:
         missing.append('requests')
 
     if missing:
@@ -121,6 +117,34 @@ def check_dependencies() -> bool:
     return True
 
 
+_github_session = None
+
+
+def get_github_session():
+    """
+    Get the shared requests session for api.github.com, creating it on first use.
+
+    The session keeps the TLS connection alive across token checks and
+    retries transient 502/503/504 responses with a short backoff.
+
+    Returns:
+        requests.Session
+    """
+    global _github_session
+    if _github_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[502, 503, 504], raise_on_status=False)
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+        session.headers["Accept"] = "application/vnd.github.v3+json"
+        _github_session = session
+    return _github_session
+
+
 def test_github_token(owner: str, token: str) -> bool:
     """
     Test if the GitHub PAT token is valid.
@@ -139,13 +163,10 @@ def test_github_token(owner: str, token: str) -> bool:
         return True  # Assume valid
 
     url = "https://api.github.com/user"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_github_session().get(url, headers=headers, timeout=10)
         if response.status_code == 200:
             user_data = response.json()
             print_info(f"Authenticated as: {user_data.get('login', 'unknown')}")
@@ -7,9 +7,47 @@ preserving user progress (COMPLETED, IN_PROGRESS, SKIPPED, BLOCKED).
 """
 
 import json
+import os
+import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Shared .git walk, cached per directory
+from token_manager import find_project_root
+
+# orjson parses/serializes status files several times faster; optional, and
+# imported on first use so scripts that never touch a status file skip it
+_orjson = None
+
+
+def _get_orjson():
+    """Return the orjson module, or None if it is not installed."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
+
+
+def _loads(data: bytes):
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 
 class CommentStatus:
@@ -20,27 +58,14 @@ class CommentStatus:
     SKIPPED = "SKIPPED"
     BLOCKED = "BLOCKED"
 
+    # For membership checks; all_statuses() keeps the display order
+    VALID = frozenset((ACTIVE, COMPLETED, IN_PROGRESS, SKIPPED, BLOCKED))
+
     @classmethod
     def all_statuses(cls):
         return [cls.ACTIVE, cls.COMPLETED, cls.IN_PROGRESS, cls.SKIPPED, cls.BLOCKED]
 
 
-def find_project_root() -> Optional[Path]:
-    """Find the project root by searching upward for a .git folder."""
-    current = Path.cwd()
-
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-
-    # Check root directory as well
-    if (current / ".git").exists():
-        return current
-
-    return None
-
-
 def get_status_dir(project_root: Optional[Path] = None) -> Path:
     """
     Get status directory path in the project's .claude folder.
@@ -61,6 +86,45 @@ def get_status_dir(project_root: Optional[Path] = None) -> Path:
     return project_root / ".claude" / "pr-status"
 
 
+def _resolve_project_root(project_root: Optional[Path] = None,
+                          working_dir: Optional[Path] = None) -> Path:
+    """Project root for a tracker: given, found from working_dir, found from cwd, or cwd."""
+    if not project_root and working_dir:
+        project_root = find_project_root(working_dir) or Path(working_dir)
+    return project_root or find_project_root() or Path.cwd()
+
+
+def get_status_file(pr_number: int, project_root: Optional[Path] = None,
+                    working_dir: Optional[Path] = None) -> Path:
+    """
+    Get the status file path for a PR without loading it.
+
+    Args:
+        pr_number: Pull request number
+        project_root: Project root path (auto-detected if not provided)
+        working_dir: Directory to resolve the project root from when
+                     project_root is not given
+
+    Returns:
+        Path to the PR's status file (which may not exist yet)
+    """
+    status_dir = get_status_dir(_resolve_project_root(project_root, working_dir))
+    return status_dir / f"pr-{pr_number}-status.json"
+
+
+# [second, isoformat] of the last timestamp produced by _now_iso
+_timestamp_cache = [0, '']
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string, formatted at most once per second."""
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _timestamp_cache[1]
+
+
 class StatusTracker:
     """Manages persistent status tracking for PR comments."""
 
@@ -75,12 +139,16 @@ class StatusTracker:
         self.pr_number = pr_number
         self.project_root = project_root or find_project_root() or Path.cwd()
         self.statuses = {}
-
-        # Status files stored in project's .claude/pr-status/ folder
+        # Set by the mutators; save() is a no-op while the statuses are unchanged
+        self._dirty = False
+        # Thread ID -> interned status key, so repeat lookups skip str()
+        self._key_cache: Dict[int, str] = {}
+        # (st_mtime_ns, st_size) of the file as last loaded or saved
+        self._file_stamp: Optional[Tuple[int, int]] = None
+
+        # Status files stored in project's .claude/pr-status/ folder;
+        # the directory is created on first save, not here
         self.status_dir = get_status_dir(self.project_root)
-
-        # Ensure directory exists
-        self.status_dir.mkdir(parents=True, exist_ok=True)
         self.status_file = self.status_dir / f"pr-{pr_number}-status.json"
 
     def load(self) -> bool:
@@ -90,15 +158,18 @@ class StatusTracker:
         Returns:
             True if file exists and was loaded successfully, False otherwise
         """
-        if not self.status_file.exists():
+        try:
+            st = self.status_file.stat()
+        except OSError:
             return False
 
         try:
-            with open(self.status_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.statuses = data.get('threads', {})
-                return True
-        except (json.JSONDecodeError, OSError) as e:
+            data = _loads(self.status_file.read_bytes())
+            self.statuses = data.get('threads', {})
+            self._dirty = False
+            self._file_stamp = (st.st_mtime_ns, st.st_size)
+            return True
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
             print(f"Warning: Failed to load status file: {e}")
             return False
 
@@ -107,22 +178,74 @@ class StatusTracker:
         Save status data to file.
 
         Returns:
-            True if saved successfully, False otherwise
+            True if saved successfully (or nothing changed), False otherwise
         """
+        if not self._dirty:
+            return True
+
         try:
             data = {
                 'pr_number': self.pr_number,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': _now_iso(),
                 'threads': self.statuses
             }
 
-            with open(self.status_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            payload = _dumps(data)
+            self.status_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a uniquely named temp file and swap it in, so a crash
+            # mid-write never leaves a truncated status file behind and
+            # concurrent saves never share a temp path
+            import tempfile
+            fd, temp_path = tempfile.mkstemp(prefix=f".{self.status_file.name}.", suffix='.tmp',
+                                             dir=self.status_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp creates the file 0600; give it the mode a plain open() would
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temp_path, 0o666 & ~umask)
+                os.replace(temp_path, self.status_file)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+
+            st = self.status_file.stat()
+            self._dirty = False
+            self._file_stamp = (st.st_mtime_ns, st.st_size)
             return True
         except OSError as e:
             print(f"Warning: Failed to save status file: {e}")
             return False
 
+    def _key(self, thread_id) -> str:
+        """Return the (interned) string key used in self.statuses for a thread ID."""
+        if isinstance(thread_id, str):
+            return thread_id
+        key = self._key_cache.get(thread_id)
+        if key is None:
+            key = self._key_cache[thread_id] = sys.intern(str(thread_id))
+        return key
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the status file changed on disk since this tracker last loaded or saved it.
+
+        Returns:
+            True if the file was written (or removed) by someone else
+        """
+        try:
+            st = self.status_file.stat()
+        except OSError:
+            return self._file_stamp is not None
+        return self._file_stamp != (st.st_mtime_ns, st.st_size)
+
     def get_status(self, thread_id: int) -> Optional[Dict]:
         """
         Get status for a specific thread.
@@ -133,7 +256,7 @@ class StatusTracker:
         Returns:
             Status dict with 'status', 'updated_at', and optional 'note', or None
         """
-        return self.statuses.get(str(thread_id))
+        return self.statuses.get(self._key(thread_id))
 
     def set_status(self, thread_id: int, status: str, note: Optional[str] = None) -> None:
         """
@@ -144,14 +267,29 @@ class StatusTracker:
             status: One of CommentStatus values (ACTIVE, COMPLETED, IN_PROGRESS, SKIPPED, BLOCKED)
             note: Optional note/reason for the status
         """
-        if status not in CommentStatus.all_statuses():
-            raise ValueError(f"Invalid status: {status}. Must be one of {CommentStatus.all_statuses()}")
+        self.set_statuses([(thread_id, status, note)])
+
+    def set_statuses(self, items: List[Tuple[int, str, Optional[str]]]) -> None:
+        """
+        Set status for several threads at once, sharing one timestamp.
+
+        All items are validated before any is applied.
 
-        self.statuses[str(thread_id)] = {
-            'status': status,
-            'updated_at': datetime.now().isoformat(),
-            'note': note
-        }
+        Args:
+            items: (thread_id, status, note) tuples, as for set_status
+        """
+        for _, status, _ in items:
+            if status not in CommentStatus.VALID:
+                raise ValueError(f"Invalid status: {status}. Must be one of {CommentStatus.all_statuses()}")
+
+        now = _now_iso()
+        for thread_id, status, note in items:
+            self.statuses[self._key(thread_id)] = {
+                'status': status,
+                'updated_at': now,
+                'note': note
+            }
+        self._dirty = True
 
     def remove_status(self, thread_id: int) -> bool:
         """
@@ -163,9 +301,10 @@ class StatusTracker:
         Returns:
             True if status was removed, False if it didn't exist
         """
-        thread_key = str(thread_id)
+        thread_key = self._key(thread_id)
         if thread_key in self.statuses:
             del self.statuses[thread_key]
+            self._dirty = True
             return True
         return False
 
@@ -182,38 +321,44 @@ class StatusTracker:
         Returns:
             Enriched thread list with custom_status field added where applicable
         """
+        statuses = self.statuses
+        key = self._key
         enriched_threads = []
 
         for thread in threads:
             thread_id = thread.get('id')
-            if not thread_id:
-                enriched_threads.append(thread)
-                continue
-
-            # Get custom status if it exists
-            custom_status = self.get_status(thread_id)
+            custom_status = None
+            if thread_id and statuses:
+                custom_status = statuses.get(key(thread_id))
 
             if custom_status:
-                # Add custom status info to thread
-                thread_copy = thread.copy()
-                thread_copy['custom_status'] = custom_status
-                enriched_threads.append(thread_copy)
+                # Only threads with a custom status get a (shallow) copy
+                enriched_threads.append({**thread, 'custom_status': custom_status})
             else:
                 enriched_threads.append(thread)
 
         return enriched_threads
 
-    def get_all_statuses(self) -> Dict[str, Dict]:
+    def get_all_statuses(self, snapshot: bool = False) -> Mapping[str, Dict]:
         """
         Get all tracked statuses.
 
+        Args:
+            snapshot: Return an independent dict copy instead of a live view
+
         Returns:
-            Dict mapping thread IDs to status information
+            Read-only view mapping thread IDs to status information; it
+            reflects later changes to the tracker. With snapshot=True, a
+            dict copy taken now.
         """
-        return self.statuses.copy()
+        if snapshot:
+            return dict(self.statuses)
+        return MappingProxyType(self.statuses)
 
     def clear_all(self) -> None:
         """Clear all tracked statuses."""
+        if self.statuses:
+            self._dirty = True
         self.statuses = {}
 
     def delete_file(self) -> bool:
@@ -232,23 +377,54 @@ class StatusTracker:
         return False
 
 
-def create_status_tracker(pr_number: int, project_root: Optional[Path] = None) -> StatusTracker:
+# Trackers handed out by create_status_tracker: {(pr_number, project_root): tracker}
+_tracker_cache: Dict[Tuple[int, str], StatusTracker] = {}
+_tracker_lock = threading.Lock()
+
+
+def invalidate_tracker_cache() -> None:
+    """Forget all trackers returned by create_status_tracker."""
+    with _tracker_lock:
+        _tracker_cache.clear()
+
+
+def create_status_tracker(pr_number: int, project_root: Optional[Path] = None,
+                          working_dir: Optional[Path] = None) -> StatusTracker:
     """
     Factory function to create and initialize a status tracker.
 
     Args:
         pr_number: The pull request number
         project_root: Project root path (auto-detected if not provided)
+        working_dir: Directory to resolve the project root from when
+                     project_root is not given (older callers passed this);
+                     used as-is if it is not inside a git repository
 
     Returns:
-        Initialized StatusTracker instance with data loaded if available
+        Initialized StatusTracker instance with data loaded if available.
+        Repeated calls for the same PR and project return the same instance,
+        reloaded first if another process changed the file (and it has no
+        unsaved changes).
 
     Example:
         tracker = create_status_tracker(123)
         tracker = create_status_tracker(123, project_root=Path('/path/to/project'))
     """
-    tracker = StatusTracker(pr_number, project_root)
-    tracker.load()  # Load existing data if available
+    project_root = _resolve_project_root(project_root, working_dir)
+
+    key = (pr_number, str(project_root))
+    with _tracker_lock:
+        tracker = _tracker_cache.get(key)
+        if tracker is None:
+            tracker = StatusTracker(pr_number, project_root)
+            tracker.load()  # Load existing data if available
+            _tracker_cache[key] = tracker
+        elif not tracker._dirty and tracker.is_stale():
+            # Start from empty so a deleted or unreadable file does not
+            # leave the previous statuses in place
+            tracker.statuses = {}
+            tracker._file_stamp = None
+            tracker.load()
     return tracker
 
 
@@ -263,11 +439,10 @@ def get_status_file_info(pr_number: int, project_root: Optional[Path] = None) ->
     Returns:
         Dict with 'path', 'exists', 'directory' keys
     """
-    status_dir = get_status_dir(project_root)
-    status_file = status_dir / f"pr-{pr_number}-status.json"
+    status_file = get_status_file(pr_number, project_root)
 
     return {
         'path': status_file,
         'exists': status_file.exists(),
-        'directory': status_dir
+        'directory': status_file.parent
     }
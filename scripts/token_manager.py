@@ -16,17 +16,17 @@ GitHub:
 3. Interactive prompt (offer to save to keychain)
 """
 
+import codecs
+import functools
+import json
 import os
 import sys
-import getpass
-from typing import Optional, Tuple, Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Callable
 
-# Try to import requests for token validation
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# requests is only needed for token validation; imported by get_session()
+REQUESTS_AVAILABLE = find_spec('requests') is not None
 
 # Service name for keychain storage
 KEYCHAIN_SERVICE = "pr-review-plugin"
@@ -39,34 +39,93 @@ ENV_VAR_NAME_ADO = "AZURE_DEVOPS_PAT"
 KEYCHAIN_ACCOUNT_GITHUB = "github-pat"
 ENV_VAR_NAME_GITHUB = "GITHUB_PAT"
 
+# Template values that mean "no token configured"
+PLACEHOLDER_TOKENS = frozenset((
+    'YOUR_AZURE_DEVOPS_PAT_HERE',
+    'PLACEHOLDER_TOKEN_NEEDS_TO_BE_SET',
+    'your-token-here'
+))
+
+
+def _is_valid_token(token: Optional[str], min_len: int = 20) -> bool:
+    """Whether token is long enough to be a PAT and is not a template placeholder."""
+    return bool(token) and len(token) >= min_len and token not in PLACEHOLDER_TOKENS
+
+
 # Legacy aliases for backward compatibility
 KEYCHAIN_ACCOUNT = KEYCHAIN_ACCOUNT_ADO
 ENV_VAR_NAME = ENV_VAR_NAME_ADO
 
-# Try to import keyring (optional dependency)
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
+# keyring is optional and slow to import (it probes its backends: dbus /
+# Secret Service, macOS Security, ...). Only check that it is installed here;
+# the module is imported by get_keyring() the first time the keychain is used.
+KEYRING_AVAILABLE = find_spec('keyring') is not None
+
+_keyring = None
+
+
+def get_keyring():
+    """
+    Import keyring on first use.
+
+    Returns:
+        The keyring module, or None if it is not installed or fails to import
+    """
+    global _keyring
+    if _keyring is None:
+        try:
+            import keyring
+            _keyring = keyring
+        except ImportError:
+            _keyring = False
+    return _keyring or None
+
+
+# Keychain reads for this process, including misses (None), so each account
+# costs at most one keyring IPC: {(service, account): password}
+_keychain_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+
+def invalidate_keychain_cache() -> None:
+    """Forget cached keychain reads."""
+    _keychain_cache.clear()
+
+
+def get_keychain_password(keyring, account: str) -> Optional[str]:
+    """
+    Read a password from the keychain, caching the result per account.
+
+    Args:
+        keyring: The keyring module (from get_keyring())
+        account: Keychain account name
+
+    Returns:
+        The stored password, or None if there is none
+
+    Raises:
+        Whatever the keyring backend raises; failures are not cached
+    """
+    key = (KEYCHAIN_SERVICE, account)
+    if key not in _keychain_cache:
+        _keychain_cache[key] = keyring.get_password(KEYCHAIN_SERVICE, account)
+    return _keychain_cache[key]
 
 
 def get_token_from_env() -> Optional[str]:
     """Get token from environment variable."""
-    token = os.getenv(ENV_VAR_NAME)
-    if token and len(token) >= 20:
-        return token
-    return None
+    token = os.environ.get(ENV_VAR_NAME)
+    return token if _is_valid_token(token) else None
 
 
 def get_token_from_keychain() -> Optional[str]:
     """Get token from system keychain."""
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         return None
 
     try:
-        token = keyring.get_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)
-        if token and len(token) >= 20:
+        token = get_keychain_password(keyring, KEYCHAIN_ACCOUNT)
+        if _is_valid_token(token):
             return token
     except Exception:
         # Keychain access failed (permissions, not available, etc.)
@@ -81,13 +140,15 @@ def save_token_to_keychain(token: str) -> bool:
     Returns:
         True if saved successfully, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         print("Warning: keyring library not installed. Cannot save to keychain.", file=sys.stderr)
         print("Install with: pip install keyring", file=sys.stderr)
         return False
 
     try:
         keyring.set_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT, token)
+        _keychain_cache[(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)] = token
         return True
     except Exception as e:
         print(f"Warning: Failed to save token to keychain: {e}", file=sys.stderr)
@@ -101,24 +162,84 @@ def delete_token_from_keychain() -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         print("Warning: keyring library not installed.", file=sys.stderr)
         return False
 
+    # Already read as missing in this process: nothing to delete
+    key = (KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)
+    if key in _keychain_cache and _keychain_cache[key] is None:
+        return False
+
     try:
         keyring.delete_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)
+        _keychain_cache[key] = None
         return True
     except keyring.errors.PasswordDeleteError:
         # Token doesn't exist
+        _keychain_cache[key] = None
         return False
     except Exception as e:
         print(f"Warning: Failed to delete token from keychain: {e}", file=sys.stderr)
         return False
 
 
+# Accepted answers to the save-to-keychain question
+_YES = frozenset(('y', 'yes'))
+
+# Separator rules shared by the banners and status output
+_SEP_EQ_60 = "=" * 60
+_SEP_EQ_50 = "=" * 50
+_SEP_DASH_50 = "-" * 50
+_SEP_DASH_40 = "-" * 40
+_SEP_DASH_30 = "-" * 30
+
+# Multi-line stderr messages, each emitted with a single write
+_DEPRECATION_BANNER = "\n".join([
+    "",
+    _SEP_EQ_60,
+    "DEPRECATION WARNING: Token stored in config file",
+    _SEP_EQ_60,
+    "Storing tokens in plaintext config files is insecure.",
+    "",
+    "Recommended alternatives:",
+    f"  1. Environment variable: export {ENV_VAR_NAME}='your-token'",
+    "  2. System keychain: python scripts/token_manager.py --save" if KEYRING_AVAILABLE
+    else "  2. System keychain: pip install keyring && python scripts/token_manager.py --save",
+    "",
+    _SEP_EQ_60,
+    "",
+    "",
+])
+
+_ADO_PROMPT_BANNER = "\n".join([
+    "",
+    "Azure DevOps Personal Access Token (PAT) required",
+    _SEP_DASH_50,
+    "Create a PAT at: https://dev.azure.com/{org}/_usersSettings/tokens",
+    "Required scope: Code (Read)",
+    "",
+    "",
+])
+
+_GH_PROMPT_BANNER = "\n".join([
+    "",
+    "GitHub Personal Access Token (PAT) required",
+    _SEP_DASH_50,
+    "Create a PAT at: https://github.com/settings/tokens",
+    "Required scope: repo (for private repos) or public_repo (for public repos)",
+    "",
+    "",
+])
+
+# The config-token deprecation warning is shown once per process
+_config_warning_shown = False
+
+
 def get_token_from_config(config: dict) -> Optional[str]:
     """
-    Get token from config file with deprecation warning.
+    Get token from config file with deprecation warning (shown once per process).
 
     Args:
         config: Configuration dictionary
@@ -127,38 +248,16 @@ def get_token_from_config(config: dict) -> Optional[str]:
         Token if valid, None otherwise
     """
     token = config.get('token')
-    if not token:
-        return None
-
-    # Check for placeholder values
-    placeholder_values = [
-        'YOUR_AZURE_DEVOPS_PAT_HERE',
-        'PLACEHOLDER_TOKEN_NEEDS_TO_BE_SET',
-        'your-token-here'
-    ]
-    if token in placeholder_values:
-        return None
-
-    # Validate token length
-    if len(token) < 20:
+    if not _is_valid_token(token):
         return None
 
     # Show deprecation warning
-    print("", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
-    print("DEPRECATION WARNING: Token stored in config file", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
-    print("Storing tokens in plaintext config files is insecure.", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("Recommended alternatives:", file=sys.stderr)
-    print(f"  1. Environment variable: export {ENV_VAR_NAME}='your-token'", file=sys.stderr)
-    if KEYRING_AVAILABLE:
-        print("  2. System keychain: python scripts/token_manager.py --save", file=sys.stderr)
-    else:
-        print("  2. System keychain: pip install keyring && python scripts/token_manager.py --save", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
-    print("", file=sys.stderr)
+    global _config_warning_shown
+    if _config_warning_shown:
+        return token
+    _config_warning_shown = True
+
+    sys.stderr.write(_DEPRECATION_BANNER)
 
     return token
 
@@ -173,12 +272,14 @@ def prompt_for_token(offer_keychain_save: bool = True) -> Optional[str]:
     Returns:
         Token if provided, None if cancelled
     """
-    print("", file=sys.stderr)
-    print("Azure DevOps Personal Access Token (PAT) required", file=sys.stderr)
-    print("-" * 50, file=sys.stderr)
-    print("Create a PAT at: https://dev.azure.com/{org}/_usersSettings/tokens", file=sys.stderr)
-    print("Required scope: Code (Read)", file=sys.stderr)
-    print("", file=sys.stderr)
+    if not sys.stdin.isatty():
+        print(f"Error: No token found and stdin is not a TTY; set {ENV_VAR_NAME_ADO} or run interactively.",
+              file=sys.stderr)
+        return None
+
+    import getpass
+
+    sys.stderr.write(_ADO_PROMPT_BANNER)
 
     try:
         token = getpass.getpass("Enter your PAT token (input hidden): ")
@@ -186,7 +287,7 @@ def prompt_for_token(offer_keychain_save: bool = True) -> Optional[str]:
         print("\nCancelled.", file=sys.stderr)
         return None
 
-    if not token or len(token) < 20:
+    if not _is_valid_token(token):
         print("Error: Invalid token (too short or empty)", file=sys.stderr)
         return None
 
@@ -195,7 +296,7 @@ def prompt_for_token(offer_keychain_save: bool = True) -> Optional[str]:
         print("", file=sys.stderr)
         try:
             save_response = input("Save token to system keychain for future use? (y/n): ")
-            if save_response.lower() in ['y', 'yes']:
+            if save_response.strip().lower() in _YES:
                 if save_token_to_keychain(token):
                     print("Token saved to keychain successfully.", file=sys.stderr)
                 else:
@@ -224,9 +325,10 @@ def resolve_token(config: Optional[dict] = None, prompt_if_missing: bool = True)
         Tuple of (token, source) where source is one of:
         'env', 'keychain', 'config', 'prompt', or 'none'
     """
-    # 1. Try environment variable
-    token = get_token_from_env()
-    if token:
+    # 1. Environment variable: the common (CI) case, checked before anything
+    # else so it never touches the keychain
+    token = os.environ.get(ENV_VAR_NAME_ADO)
+    if _is_valid_token(token):
         return (token, 'env')
 
     # 2. Try system keychain
@@ -255,20 +357,19 @@ def resolve_token(config: Optional[dict] = None, prompt_if_missing: bool = True)
 
 def get_github_token_from_env() -> Optional[str]:
     """Get GitHub token from environment variable."""
-    token = os.getenv(ENV_VAR_NAME_GITHUB)
-    if token and len(token) >= 20:
-        return token
-    return None
+    token = os.environ.get(ENV_VAR_NAME_GITHUB)
+    return token if _is_valid_token(token) else None
 
 
 def get_github_token_from_keychain() -> Optional[str]:
     """Get GitHub token from system keychain."""
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         return None
 
     try:
-        token = keyring.get_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT_GITHUB)
-        if token and len(token) >= 20:
+        token = get_keychain_password(keyring, KEYCHAIN_ACCOUNT_GITHUB)
+        if _is_valid_token(token):
             return token
     except Exception:
         # Keychain access failed (permissions, not available, etc.)
@@ -283,13 +384,15 @@ def save_github_token_to_keychain(token: str) -> bool:
     Returns:
         True if saved successfully, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         print("Warning: keyring library not installed. Cannot save to keychain.", file=sys.stderr)
         print("Install with: pip install keyring", file=sys.stderr)
         return False
 
     try:
         keyring.set_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT_GITHUB, token)
+        _keychain_cache[(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT_GITHUB)] = token
         return True
     except Exception as e:
         print(f"Warning: Failed to save token to keychain: {e}", file=sys.stderr)
@@ -303,15 +406,23 @@ def delete_github_token_from_keychain() -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = get_keyring()
+    if keyring is None:
         print("Warning: keyring library not installed.", file=sys.stderr)
         return False
 
+    # Already read as missing in this process: nothing to delete
+    key = (KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT_GITHUB)
+    if key in _keychain_cache and _keychain_cache[key] is None:
+        return False
+
     try:
         keyring.delete_password(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT_GITHUB)
+        _keychain_cache[key] = None
         return True
     except keyring.errors.PasswordDeleteError:
         # Token doesn't exist
+        _keychain_cache[key] = None
         return False
     except Exception as e:
         print(f"Warning: Failed to delete token from keychain: {e}", file=sys.stderr)
@@ -328,12 +439,14 @@ def prompt_for_github_token(offer_keychain_save: bool = True) -> Optional[str]:
     Returns:
         Token if provided, None if cancelled
     """
-    print("", file=sys.stderr)
-    print("GitHub Personal Access Token (PAT) required", file=sys.stderr)
-    print("-" * 50, file=sys.stderr)
-    print("Create a PAT at: https://github.com/settings/tokens", file=sys.stderr)
-    print("Required scope: repo (for private repos) or public_repo (for public repos)", file=sys.stderr)
-    print("", file=sys.stderr)
+    if not sys.stdin.isatty():
+        print(f"Error: No token found and stdin is not a TTY; set {ENV_VAR_NAME_GITHUB} or run interactively.",
+              file=sys.stderr)
+        return None
+
+    import getpass
+
+    sys.stderr.write(_GH_PROMPT_BANNER)
 
     try:
         token = getpass.getpass("Enter your GitHub PAT token (input hidden): ")
@@ -341,7 +454,7 @@ def prompt_for_github_token(offer_keychain_save: bool = True) -> Optional[str]:
         print("\nCancelled.", file=sys.stderr)
         return None
 
-    if not token or len(token) < 10:
+    if not _is_valid_token(token, min_len=10):
         print("Error: Invalid token (too short or empty)", file=sys.stderr)
         return None
 
@@ -350,7 +463,7 @@ def prompt_for_github_token(offer_keychain_save: bool = True) -> Optional[str]:
         print("", file=sys.stderr)
         try:
             save_response = input("Save token to system keychain for future use? (y/n): ")
-            if save_response.lower() in ['y', 'yes']:
+            if save_response.strip().lower() in _YES:
                 if save_github_token_to_keychain(token):
                     print("Token saved to keychain successfully.", file=sys.stderr)
                 else:
@@ -377,9 +490,9 @@ def resolve_github_token(prompt_if_missing: bool = True) -> Tuple[Optional[str],
         Tuple of (token, source) where source is one of:
         'env', 'keychain', 'prompt', or 'none'
     """
-    # 1. Try environment variable
-    token = get_github_token_from_env()
-    if token:
+    # 1. Environment variable, checked before the keychain
+    token = os.environ.get(ENV_VAR_NAME_GITHUB)
+    if _is_valid_token(token):
         return (token, 'env')
 
     # 2. Try system keychain
@@ -400,6 +513,33 @@ def resolve_github_token(prompt_if_missing: bool = True) -> Tuple[Optional[str],
 # Token Validation Functions
 # =============================================================================
 
+_session = None
+
+
+def get_session():
+    """
+    Get the shared requests session for token validation, creating it on first use.
+
+    Keeps TLS connections alive across validations (renewal retries) and
+    retries rate-limited or transient 429/502/503/504 responses with backoff.
+
+    Returns:
+        requests.Session
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=retry))
+        _session = session
+    return _session
+
+
 def validate_ado_token(token: str, org: str) -> Tuple[bool, str]:
     """
     Validate an Azure DevOps token by making a test API call.
@@ -424,9 +564,10 @@ def validate_ado_token(token: str, org: str) -> Tuple[bool, str]:
         "Content-Type": "application/json"
     }
 
+    import requests
     try:
         url = f"https://dev.azure.com/{org}/_apis/projects?api-version=7.1&$top=1"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_session().get(url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             return (True, "")
@@ -462,8 +603,9 @@ def validate_github_token(token: str) -> Tuple[bool, str]:
         "X-GitHub-Api-Version": "2022-11-28"
     }
 
+    import requests
     try:
-        response = requests.get("https://api.github.com/user", headers=headers, timeout=10)
+        response = get_session().get("https://api.github.com/user", headers=headers, timeout=10)
 
         if response.status_code == 200:
             return (True, "")
@@ -498,9 +640,9 @@ def renew_ado_token(org: str, update_headers_callback: Optional[Callable[[str],
         New valid token if successful, None if cancelled or failed
     """
     print("", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
+    print(_SEP_EQ_60, file=sys.stderr)
     print("TOKEN EXPIRED OR INVALID", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
+    print(_SEP_EQ_60, file=sys.stderr)
     print("Your Azure DevOps PAT token has expired or is invalid.", file=sys.stderr)
     print("", file=sys.stderr)
     print("To continue, you need to enter a new PAT token.", file=sys.stderr)
@@ -509,6 +651,8 @@ def renew_ado_token(org: str, update_headers_callback: Optional[Callable[[str],
     print("Required scope: Code (Read)", file=sys.stderr)
     print("", file=sys.stderr)
 
+    import getpass
+
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
@@ -517,7 +661,7 @@ def renew_ado_token(org: str, update_headers_callback: Optional[Callable[[str],
             print("\nCancelled.", file=sys.stderr)
             return None
 
-        if not token or len(token) < 20:
+        if not _is_valid_token(token):
             print("Error: Invalid token (too short or empty)", file=sys.stderr)
             if attempt < max_attempts - 1:
                 print("Please try again.", file=sys.stderr)
@@ -535,7 +679,7 @@ def renew_ado_token(org: str, update_headers_callback: Optional[Callable[[str],
                 print("", file=sys.stderr)
                 try:
                     save_response = input("Save token to system keychain for future use? (y/n): ")
-                    if save_response.lower() in ['y', 'yes']:
+                    if save_response.strip().lower() in _YES:
                         if save_token_to_keychain(token):
                             print("Token saved to keychain successfully.", file=sys.stderr)
                         else:
@@ -574,9 +718,9 @@ def renew_github_token(update_headers_callback: Optional[Callable[[str], None]]
         New valid token if successful, None if cancelled or failed
     """
     print("", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
+    print(_SEP_EQ_60, file=sys.stderr)
     print("TOKEN EXPIRED OR INVALID", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
+    print(_SEP_EQ_60, file=sys.stderr)
     print("Your GitHub PAT token has expired or is invalid.", file=sys.stderr)
     print("", file=sys.stderr)
     print("To continue, you need to enter a new PAT token.", file=sys.stderr)
@@ -585,6 +729,8 @@ def renew_github_token(update_headers_callback: Optional[Callable[[str], None]]
     print("Required scope: repo (for private repos) or public_repo (for public repos)", file=sys.stderr)
     print("", file=sys.stderr)
 
+    import getpass
+
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
@@ -593,7 +739,7 @@ def renew_github_token(update_headers_callback: Optional[Callable[[str], None]]
             print("\nCancelled.", file=sys.stderr)
             return None
 
-        if not token or len(token) < 10:
+        if not _is_valid_token(token, min_len=10):
             print("Error: Invalid token (too short or empty)", file=sys.stderr)
             if attempt < max_attempts - 1:
                 print("Please try again.", file=sys.stderr)
@@ -611,7 +757,7 @@ def renew_github_token(update_headers_callback: Optional[Callable[[str], None]]
                 print("", file=sys.stderr)
                 try:
                     save_response = input("Save token to system keychain for future use? (y/n): ")
-                    if save_response.lower() in ['y', 'yes']:
+                    if save_response.strip().lower() in _YES:
                         if save_github_token_to_keychain(token):
                             print("Token saved to keychain successfully.", file=sys.stderr)
                         else:
@@ -636,8 +782,88 @@ def renew_github_token(update_headers_callback: Optional[Callable[[str], None]]
     return None
 
 
-def main():
-    """CLI interface for token management."""
+def find_project_root(start: Optional[str] = None) -> Optional[Path]:
+    """
+    Find the project root by searching upward for a .git folder.
+
+    The other scripts import this rather than walking the tree themselves.
+
+    Args:
+        start: Directory to search from (default: current directory)
+
+    Returns:
+        Project root path, or None if not inside a git repository
+    """
+    return _find_project_root_cached(os.path.abspath(start) if start else os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _find_project_root_cached(cwd: str) -> Optional[Path]:
+    """Walk upward from cwd; cached per directory so repeat lookups skip the stats."""
+    current = cwd
+
+    while True:
+        # lexists: .git is a file in worktrees/submodules and may be a symlink
+        if os.path.lexists(os.path.join(current, ".git")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            # Checked the filesystem root as well
+            return None
+        current = parent
+
+
+def _load_config(path: Path) -> dict:
+    """
+    Load a JSON config file, tolerating a UTF-8 BOM.
+
+    Raises:
+        OSError, UnicodeDecodeError, json.JSONDecodeError: If the file cannot be read or parsed
+    """
+    raw = path.read_bytes()
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    return json.loads(raw)
+
+
+# Flags main() can dispatch on without building the argparse parser
+_CLI_ACTION_FLAGS = frozenset(('--save', '--delete', '--status'))
+_CLI_PLATFORMS = ('azure-devops', 'github')
+
+
+def _parse_args_fast(argv: list):
+    """
+    Parse the plain flag forms of the CLI without argparse.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Namespace with save/delete/status/platform, or None when argv needs the
+        full parser (no action, --help, unknown or abbreviated flags, bad values)
+    """
+    from types import SimpleNamespace
+
+    args = SimpleNamespace(save=False, delete=False, status=False, platform='azure-devops')
+    it = iter(argv)
+    for arg in it:
+        if arg in _CLI_ACTION_FLAGS:
+            setattr(args, arg[2:], True)
+        elif arg == '--platform':
+            value = next(it, None)
+            if value not in _CLI_PLATFORMS:
+                return None
+            args.platform = value
+        else:
+            return None
+
+    if not (args.save or args.delete or args.status):
+        return None
+    return args
+
+
+def _build_parser():
+    """Build the full argparse parser (used for --help and anything _parse_args_fast declines)."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -679,7 +905,18 @@ Resolution Order:
     parser.add_argument('--platform', choices=['azure-devops', 'github'], default='azure-devops',
                         help='Platform to manage tokens for (default: azure-devops)')
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """CLI interface for token management."""
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+        if not (args.save or args.delete or args.status):
+            parser.print_help()
+            return
 
     # Determine platform-specific settings
     is_github = args.platform == 'github'
@@ -698,14 +935,15 @@ Resolution Order:
             sys.exit(1)
 
         print(f"Save {platform_name} PAT to system keychain")
-        print("-" * 40)
+        print(_SEP_DASH_40)
+        import getpass
         try:
             token = getpass.getpass("Enter your PAT token (input hidden): ")
         except (KeyboardInterrupt, EOFError):
             print("\nCancelled.")
             sys.exit(1)
 
-        if not token or len(token) < 20:
+        if not _is_valid_token(token):
             print("Error: Invalid token (too short or empty)")
             sys.exit(1)
 
@@ -723,7 +961,7 @@ Resolution Order:
             sys.exit(1)
 
         print(f"Delete {platform_name} PAT from system keychain")
-        print("-" * 40)
+        print(_SEP_DASH_40)
 
         if delete_func():
             print("Token deleted from system keychain.")
@@ -731,20 +969,20 @@ Resolution Order:
             print("No token found in keychain or deletion failed.")
 
     elif args.status:
-        print("PR Review Plugin - Token Status")
-        print("=" * 50)
+        # Collected and written in one go at the end
+        lines = ["PR Review Plugin - Token Status", _SEP_EQ_50]
 
         # Azure DevOps section
-        print("\n[Azure DevOps]")
-        print("-" * 30)
+        lines.append("\n[Azure DevOps]")
+        lines.append(_SEP_DASH_30)
 
         # Check environment
         ado_env_token = get_token_from_env()
         if ado_env_token:
-            print(f"[ACTIVE] Environment variable ({ENV_VAR_NAME_ADO})")
-            print(f"         Token: {ado_env_token[:4]}...{ado_env_token[-4:]}")
+            lines.append(f"[ACTIVE] Environment variable ({ENV_VAR_NAME_ADO})")
+            lines.append(f"         Token: {ado_env_token[:4]}...{ado_env_token[-4:]}")
         else:
-            print(f"[  --  ] Environment variable ({ENV_VAR_NAME_ADO})")
+            lines.append(f"[  --  ] Environment variable ({ENV_VAR_NAME_ADO})")
 
         # Check keychain
         ado_keychain_token = None
@@ -752,80 +990,62 @@ Resolution Order:
             ado_keychain_token = get_token_from_keychain()
             if ado_keychain_token:
                 status = "[ACTIVE]" if not ado_env_token else "[BACKUP]"
-                print(f"{status} System keychain ({KEYCHAIN_ACCOUNT_ADO})")
-                print(f"         Token: {ado_keychain_token[:4]}...{ado_keychain_token[-4:]}")
+                lines.append(f"{status} System keychain ({KEYCHAIN_ACCOUNT_ADO})")
+                lines.append(f"         Token: {ado_keychain_token[:4]}...{ado_keychain_token[-4:]}")
             else:
-                print(f"[  --  ] System keychain ({KEYCHAIN_ACCOUNT_ADO})")
+                lines.append(f"[  --  ] System keychain ({KEYCHAIN_ACCOUNT_ADO})")
         else:
-            print("[  --  ] System keychain (keyring not installed)")
+            lines.append("[  --  ] System keychain (keyring not installed)")
 
         # Check config file (in project root) - ADO only
-        from pathlib import Path
-
-        def find_project_root():
-            current = Path.cwd()
-            while current != current.parent:
-                if (current / ".git").exists():
-                    return current
-                current = current.parent
-            if (current / ".git").exists():
-                return current
-            return None
-
         project_root = find_project_root()
         if project_root:
             config_path = project_root / ".claude" / "pr-review.json"
             if config_path.exists():
                 try:
-                    import json
-                    with open(config_path, 'r', encoding='utf-8-sig') as f:
-                        config = json.load(f)
+                    config = _load_config(config_path)
                     config_token = config.get('token')
-                    if config_token and len(config_token) >= 20 and config_token not in [
-                        'YOUR_AZURE_DEVOPS_PAT_HERE', 'PLACEHOLDER_TOKEN_NEEDS_TO_BE_SET'
-                    ]:
+                    if _is_valid_token(config_token):
                         status = "[ACTIVE]" if not ado_env_token and not ado_keychain_token else "[BACKUP]"
-                        print(f"{status} Config file (DEPRECATED)")
-                        print(f"         Path: {config_path}")
-                        print(f"         Token: {config_token[:4]}...{config_token[-4:]}")
+                        lines.append(f"{status} Config file (DEPRECATED)")
+                        lines.append(f"         Path: {config_path}")
+                        lines.append(f"         Token: {config_token[:4]}...{config_token[-4:]}")
                     else:
-                        print(f"[  --  ] Config file (placeholder or invalid)")
-                except Exception:
-                    print(f"[ERROR ] Config file (failed to read)")
+                        lines.append(f"[  --  ] Config file (placeholder or invalid)")
+                except (json.JSONDecodeError, UnicodeDecodeError, OSError, AttributeError):
+                    lines.append(f"[ERROR ] Config file (failed to read)")
             else:
-                print(f"[  --  ] Config file (not found)")
+                lines.append(f"[  --  ] Config file (not found)")
         else:
-            print(f"[  --  ] Config file (not in a git repository)")
+            lines.append(f"[  --  ] Config file (not in a git repository)")
 
         # GitHub section
-        print("\n[GitHub]")
-        print("-" * 30)
+        lines.append("\n[GitHub]")
+        lines.append(_SEP_DASH_30)
 
         # Check environment
         gh_env_token = get_github_token_from_env()
         if gh_env_token:
-            print(f"[ACTIVE] Environment variable ({ENV_VAR_NAME_GITHUB})")
-            print(f"         Token: {gh_env_token[:4]}...{gh_env_token[-4:]}")
+            lines.append(f"[ACTIVE] Environment variable ({ENV_VAR_NAME_GITHUB})")
+            lines.append(f"         Token: {gh_env_token[:4]}...{gh_env_token[-4:]}")
         else:
-            print(f"[  --  ] Environment variable ({ENV_VAR_NAME_GITHUB})")
+            lines.append(f"[  --  ] Environment variable ({ENV_VAR_NAME_GITHUB})")
 
         # Check keychain
         if KEYRING_AVAILABLE:
             gh_keychain_token = get_github_token_from_keychain()
             if gh_keychain_token:
                 status = "[ACTIVE]" if not gh_env_token else "[BACKUP]"
-                print(f"{status} System keychain ({KEYCHAIN_ACCOUNT_GITHUB})")
-                print(f"         Token: {gh_keychain_token[:4]}...{gh_keychain_token[-4:]}")
+                lines.append(f"{status} System keychain ({KEYCHAIN_ACCOUNT_GITHUB})")
+                lines.append(f"         Token: {gh_keychain_token[:4]}...{gh_keychain_token[-4:]}")
             else:
-                print(f"[  --  ] System keychain ({KEYCHAIN_ACCOUNT_GITHUB})")
+                lines.append(f"[  --  ] System keychain ({KEYCHAIN_ACCOUNT_GITHUB})")
         else:
-            print("[  --  ] System keychain (keyring not installed)")
-
-        print("")
-        print("Resolution order: env > keychain > config (ADO only) > prompt")
+            lines.append("[  --  ] System keychain (keyring not installed)")
 
-    else:
-        parser.print_help()
+        lines.append("")
+        lines.append("Resolution order: env > keychain > config (ADO only) > prompt")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
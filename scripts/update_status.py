@@ -7,16 +7,70 @@ Used by Claude Code during PR review workflow.
 """
 
 import argparse
+import shlex
 import sys
 from pathlib import Path
 
 # Import status tracker
 try:
-    from status_tracker import create_status_tracker, CommentStatus
+    from status_tracker import create_status_tracker, get_status_file, CommentStatus
 except ImportError:
     script_dir = Path(__file__).parent
     sys.path.insert(0, str(script_dir))
-    from status_tracker import create_status_tracker, CommentStatus
+    from status_tracker import create_status_tracker, get_status_file, CommentStatus
+
+# Display order for help and error messages; membership checks use CommentStatus.VALID
+STATUS_NAMES = ", ".join(CommentStatus.all_statuses())
+
+
+def run_batch(tracker) -> int:
+    """
+    Apply status updates read from stdin, then save the tracker once.
+
+    Each non-empty line is "thread_id STATUS [note]" (shell-style quoting for
+    the note); lines starting with '#' are ignored. Nothing is written if any
+    line is invalid.
+
+    Args:
+        tracker: Loaded StatusTracker
+
+    Returns:
+        Process exit code
+    """
+    updates = []
+    for line_number, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            fields = shlex.split(line)
+        except ValueError as e:
+            print(f"ERROR: Line {line_number}: {e}", file=sys.stderr)
+            return 1
+        # isascii(): str.isdigit() also accepts digits int() rejects, such as '²'
+        if len(fields) not in (2, 3) or not (fields[0].isascii() and fields[0].isdigit()):
+            print(f"ERROR: Line {line_number}: expected 'thread_id STATUS [note]'", file=sys.stderr)
+            return 1
+        thread_id = int(fields[0])
+        status = fields[1]
+        if status not in CommentStatus.VALID:
+            print(f"ERROR: Line {line_number}: Invalid status '{status}'", file=sys.stderr)
+            print(f"Valid statuses: {STATUS_NAMES}", file=sys.stderr)
+            return 1
+        updates.append((thread_id, status, fields[2] if len(fields) == 3 else None))
+
+    if not updates:
+        print("[INFO] No updates read from stdin")
+        return 0
+
+    tracker.set_statuses(updates)
+    if not tracker.save():
+        print("ERROR: Failed to save status file", file=sys.stderr)
+        return 1
+
+    print(f"[SUCCESS] Updated {len(updates)} thread(s)")
+    print(f"[INFO] Status file: {tracker.status_file}")
+    return 0
 
 
 def main():
@@ -36,23 +90,55 @@ Examples:
 
   # Remove custom status (revert to Azure status only)
   python update_status.py 87663 782167 --clear
+
+  # Update several threads at once (one "thread_id STATUS [note]" per line,
+  # the file is written once at the end)
+  printf '%s\\n' '782167 COMPLETED' '782191 BLOCKED "Waiting for backend"' \\
+      | python update_status.py 87663 --batch
         """
     )
 
     parser.add_argument('pr_number', type=int, help='Pull request number')
-    parser.add_argument('thread_id', type=int, help='Thread ID to update')
-    parser.add_argument('status', nargs='?', help=f'Status to set: {", ".join(CommentStatus.all_statuses())}')
+    parser.add_argument('thread_id', type=int, nargs='?', help='Thread ID to update (omit with --batch)')
+    parser.add_argument('status', nargs='?', help=f'Status to set: {STATUS_NAMES}')
     parser.add_argument('--note', '-n', help='Optional note/reason for the status')
     parser.add_argument('--clear', action='store_true', help='Remove custom status for this thread')
     parser.add_argument('--working-dir', '-d', help='Working directory (default: current directory)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Read "thread_id STATUS [note]" lines from stdin and save once')
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.thread_id is not None or args.status or args.note or args.clear:
+            parser.error("--batch takes updates from stdin only")
+    elif args.thread_id is None:
+        parser.error("thread_id is required (or use --batch)")
+    elif not args.clear:
+        # Validate before resolving the working directory or loading anything
+        if not args.status:
+            print("ERROR: Status is required (or use --clear to remove status)", file=sys.stderr)
+            parser.print_help()
+            sys.exit(1)
+
+        if args.status not in CommentStatus.VALID:
+            print(f"ERROR: Invalid status '{args.status}'", file=sys.stderr)
+            print(f"Valid statuses: {STATUS_NAMES}", file=sys.stderr)
+            sys.exit(1)
+
     # Determine working directory
     working_dir = Path(args.working_dir) if args.working_dir else Path.cwd()
 
+    # Nothing to clear if the PR has no status file yet; skip loading it
+    if args.clear and not get_status_file(args.pr_number, working_dir=working_dir).exists():
+        print(f"[INFO] Thread #{args.thread_id} had no custom status")
+        sys.exit(0)
+
     # Load status tracker
-    tracker = create_status_tracker(args.pr_number, working_dir)
+    tracker = create_status_tracker(args.pr_number, working_dir=working_dir)
+
+    if args.batch:
+        sys.exit(run_batch(tracker))
 
     # Handle clear action
     if args.clear:
@@ -64,18 +150,6 @@ Examples:
             print(f"[INFO] Thread #{args.thread_id} had no custom status")
             sys.exit(0)
 
-    # Validate status argument
-    if not args.status:
-        print("ERROR: Status is required (or use --clear to remove status)", file=sys.stderr)
-        parser.print_help()
-        sys.exit(1)
-
-    # Validate status value
-    if args.status not in CommentStatus.all_statuses():
-        print(f"ERROR: Invalid status '{args.status}'", file=sys.stderr)
-        print(f"Valid statuses: {', '.join(CommentStatus.all_statuses())}", file=sys.stderr)
-        sys.exit(1)
-
     # Update status
     try:
         tracker.set_status(args.thread_id, args.status, args.note)